@@ -1,4 +1,3 @@
-import json
 import itertools
 import os
 
@@ -15,23 +14,29 @@ app = dash.Dash()
 app.css.config.serve_locally = False
 app.scripts.config.serve_locally = False
 
-streetcar_df = pandas.read_csv('../data/streetcar_travel_times.csv')
+streetcar_df = pandas.read_csv('../data/streetcar_travel_times.csv',
+                               usecols=['mon',
+                                        'dir',
+                                        'time_period',
+                                        'travel_time'],
+                               dtype={'dir': 'category',
+                                      'time_period': 'category',
+                                      'travel_time': 'float64'})
 
 streetcar_am = streetcar_df[streetcar_df['time_period'] == 'AM']
-agged = streetcar_am[['mon',
-                      'dir',
-                      'travel_time']].groupby(['mon',
-                                               'dir'],
-                                              as_index=False).sum()
-agged_wb = agged[agged['dir']=='WB']
-agged_eb = agged[agged['dir']=='EB']
+# Indexed by (dir, mon) so each direction is an index lookup, not a mask
+agged = streetcar_am.groupby(['dir',
+                              'mon'],
+                             observed=True)['travel_time'].sum()
+agged_wb = agged.loc['WB']
+agged_eb = agged.loc['EB']
 
-data = [go.Scatter(x=agged_wb['mon'],
-                   y=agged_wb['travel_time'],
+data = [go.Scatter(x=agged_wb.index,
+                   y=agged_wb.values,
                    mode='lines',
                    name='WB'),
-        go.Scatter(x=agged_eb['mon'],
-                   y=agged_eb['travel_time'],
+        go.Scatter(x=agged_eb.index,
+                   y=agged_eb.values,
                    mode='lines',
                    name='EB')
         ]